@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+
+from sqlalchemy import select
+
+from .database import SessionLocal
+from .models import Booking
+
+# How long to wait for other callers before issuing the batched query.
+BATCH_WINDOW_SECONDS = 0.001
+# Keeps each IN (...) well below SQLite's bound-parameter limit.
+MAX_BATCH_SIZE = 500
+
+
+class BookingLoader:
+    """DataLoader-style batcher for bookings keyed by time slot id.
+
+    Ids requested by concurrent callers within ``BATCH_WINDOW_SECONDS`` are
+    fetched together with a single ``time_slot_id IN (...)`` select, so a
+    burst of list requests costs one bookings query instead of one each.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[int, asyncio.Future[Booking | None]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    async def load_many(self, time_slot_ids: Iterable[int]) -> list[Booking | None]:
+        loop = asyncio.get_running_loop()
+        futures = []
+        for time_slot_id in time_slot_ids:
+            future = self._pending.get(time_slot_id)
+            if future is None:
+                future = loop.create_future()
+                self._pending[time_slot_id] = future
+            futures.append(future)
+
+        if self._pending and self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                BATCH_WINDOW_SECONDS, self._start_flush
+            )
+
+        # Futures are shared between callers; one caller being cancelled must
+        # not cancel the lookup for everybody else.
+        return list(await asyncio.gather(*(asyncio.shield(f) for f in futures)))
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        task = asyncio.ensure_future(self._flush(self._pending))
+        self._pending = {}
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, pending: dict[int, asyncio.Future[Booking | None]]) -> None:
+        ids = list(pending)
+        bookings: dict[int, Booking] = {}
+        try:
+            async with SessionLocal() as session:
+                for offset in range(0, len(ids), MAX_BATCH_SIZE):
+                    result = await session.scalars(
+                        select(Booking).where(
+                            Booking.time_slot_id.in_(ids[offset : offset + MAX_BATCH_SIZE])
+                        )
+                    )
+                    bookings.update((booking.time_slot_id, booking) for booking in result)
+        except Exception as exc:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for time_slot_id, future in pending.items():
+            if not future.done():
+                future.set_result(bookings.get(time_slot_id))
+
+
+booking_loader = BookingLoader()
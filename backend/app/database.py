@@ -1,22 +1,48 @@
-from collections.abc import Generator
+import os
+from collections.abc import AsyncGenerator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./event_booking.db"
+SQLALCHEMY_DATABASE_URL = os.getenv(
+    "DATABASE_URL", "sqlite+aiosqlite:///./event_booking.db"
+)
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
 )
-SessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
+SessionLocal = async_sessionmaker(
+    bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
 )
 Base = declarative_base()
 
 
-def get_session() -> Generator[Session, None, None]:
-    session = SessionLocal()
-    try:
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    # WAL lets readers proceed while a writer commits; the remaining pragmas
+    # keep temp tables, a 256 MiB memory map and a 64 MiB page cache in memory.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
+
+
+# DATABASE_URL may point elsewhere; these PRAGMAs only make sense for SQLite.
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", _configure_sqlite_connection)
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    async with SessionLocal() as session:
         yield session
-    finally:
-        session.close()
+
@@ -0,0 +1,66 @@
+"""In-process index of timeslot intervals used to reject overlaps early.
+
+The cache only short-circuits conflicts: a create that overlaps a known slot
+is refused without a query, but a create that passes still runs the indexed
+database check, which stays authoritative for slots written by other
+processes or not loaded here. Only slots that have not yet ended are loaded
+at startup, and each add() drops the ended slots of its category, so memory
+tracks the upcoming schedule rather than all history.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+
+
+class IntervalCache:
+    """Sorted timeslot intervals, keyed by category.
+
+    Slots within a category never overlap, so keeping them sorted by start
+    also keeps them sorted by end. An overlap test therefore only has to look
+    at the last slot starting before the candidate ends: O(log N) per check.
+    """
+
+    def __init__(self) -> None:
+        self._intervals: defaultdict[int, list[tuple[datetime, datetime]]] = (
+            defaultdict(list)
+        )
+        self._locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def load(self, rows: Iterable[tuple[int, datetime, datetime]]) -> None:
+        self._intervals.clear()
+        for category_id, start_time, end_time in rows:
+            self._intervals[category_id].append((start_time, end_time))
+        for intervals in self._intervals.values():
+            intervals.sort()
+
+    def lock(self, category_id: int) -> asyncio.Lock:
+        return self._locks[category_id]
+
+    def overlaps(self, category_id: int, start_time: datetime, end_time: datetime) -> bool:
+        intervals = self._intervals.get(category_id)
+        if not intervals:
+            return False
+        index = bisect_left(intervals, (end_time,))
+        return index > 0 and intervals[index - 1][1] > start_time
+
+    def add(
+        self,
+        category_id: int,
+        start_time: datetime,
+        end_time: datetime,
+        now: datetime | None = None,
+    ) -> None:
+        now = now or datetime.utcnow()
+        intervals = self._intervals[category_id]
+        # Ends are sorted too, so the slots that have ended form a prefix.
+        del intervals[: bisect_right(intervals, now, key=lambda interval: interval[1])]
+        if end_time > now:
+            insort(intervals, (start_time, end_time))
+
+
+interval_cache = IntervalCache()
@@ -1,16 +1,29 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import date, datetime, time, timedelta
 from typing import Annotated
 
-from fastapi import Depends, FastAPI, HTTPException, Query, status
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import and_, or_, select
-from sqlalchemy.orm import Session
-
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Connection, String, bindparam, delete, func, inspect, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from .booking_loader import booking_loader
 from .database import Base, SessionLocal, engine, get_session
+from .interval_cache import interval_cache
 from .models import Booking, EventCategory, TimeSlot
 from .schemas import (
+    CATEGORY_LIST_ADAPTER,
+    TIMESLOT_LIST_ADAPTER,
     BookingCancel,
     BookingCreate,
     BookingRead,
@@ -19,7 +32,76 @@ from .schemas import (
     TimeSlotRead,
 )
 
-app = FastAPI(title="Event Booking API", version="1.0.0")
+# Schema creation and seeding run on startup unless RUN_MIGRATIONS=0, which
+# deployments with an externally managed schema should set.
+RUN_MIGRATIONS = os.getenv("RUN_MIGRATIONS", "1") == "1"
+# DEBUG=1 makes unexpected relationship loads raise instead of running a
+# query per row, surfacing N+1 regressions during development and tests.
+DEBUG = os.getenv("DEBUG", "0") == "1"
+
+
+def _missing_columns(connection: Connection) -> list[str]:
+    inspector = inspect(connection)
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        missing.extend(
+            f"{table.name}.{column.name}"
+            for column in table.columns
+            if column.name not in existing
+        )
+    return missing
+
+
+async def init_database() -> None:
+    if RUN_MIGRATIONS:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            # create_all never alters existing tables, and SQLite cannot add
+            # stored generated columns later, so an older database must be
+            # recreated rather than failing on the first query.
+            missing = await connection.run_sync(_missing_columns)
+        if missing:
+            raise RuntimeError(
+                f"Database schema is out of date (missing {', '.join(missing)}). "
+                "Delete the SQLite database file and restart to recreate it."
+            )
+    async with SessionLocal() as session:
+        if RUN_MIGRATIONS:
+            existing = await session.scalar(
+                select(func.count()).select_from(EventCategory)
+            )
+            if not existing:
+                session.add_all(
+                    [
+                        EventCategory(name="Cat 1"),
+                        EventCategory(name="Cat 2"),
+                        EventCategory(name="Cat 3"),
+                    ]
+                )
+                await session.commit()
+
+        intervals = await session.execute(
+            select(TimeSlot.category_id, TimeSlot.start_time, TimeSlot.end_time).where(
+                TimeSlot.end_time > datetime.utcnow()
+            )
+        )
+        interval_cache.load(intervals.all())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await init_database()
+    yield
+    await engine.dispose()
+
+
+app = FastAPI(
+    title="Event Booking API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -32,43 +114,96 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-SessionDep = Annotated[Session, Depends(get_session)]
-
-
-def init_database() -> None:
-    Base.metadata.create_all(bind=engine)
-    with SessionLocal() as session:
-        existing = session.execute(select(EventCategory)).scalars().all()
-        if existing:
-            return
-        session.add_all(
-            [
-                EventCategory(name="Cat 1"),
-                EventCategory(name="Cat 2"),
-                EventCategory(name="Cat 3"),
-            ]
-        )
-        session.commit()
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
+
+# Categories are seeded at startup and never change afterwards, so the
+# serialized list is built once. Reset it from anything that mutates them.
+_categories_cache: bytes | None = None
+_categories_lock = asyncio.Lock()
+
+# Hot-path statements are built once at import and executed with bound
+# parameters, so requests skip constructing the statement each time.
+TIMESLOT_RANGE_STMT = (
+    select(TimeSlot)
+    .options(
+        selectinload(TimeSlot.category), *((raiseload("*"),) if DEBUG else ())
+    )
+    .where(
+        TimeSlot.start_time >= bindparam("start"),
+        TimeSlot.start_time < bindparam("end"),
+    )
+    .order_by(TimeSlot.start_time)
+)
+TIMESLOT_RANGE_BY_CATEGORY_STMT = TIMESLOT_RANGE_STMT.where(
+    TimeSlot.category_id.in_(bindparam("category_ids", expanding=True))
+)
 
+# Two intervals overlap iff each starts before the other ends. The
+# uq_timeslot_category_time index answers this with a single range seek.
+TIMESLOT_OVERLAP_STMT = (
+    select(TimeSlot.id)
+    .where(
+        TimeSlot.category_id == bindparam("category_id"),
+        TimeSlot.start_time < bindparam("end_time"),
+        TimeSlot.end_time > bindparam("start_time"),
+    )
+    .limit(1)
+)
 
-@app.on_event("startup")
-def on_startup() -> None:
-    init_database()
+# Selecting from time_slots makes a missing slot insert nothing, and the
+# unique time_slot_id turns a concurrent booking into a no-op rather than an
+# IntegrityError.
+BOOKING_INSERT_STMT = (
+    sqlite_insert(Booking)
+    .from_select(
+        ["time_slot_id", "user_name", "user_email"],
+        select(
+            TimeSlot.id,
+            bindparam("user_name", type_=String),
+            bindparam("user_email", type_=String),
+        ).where(TimeSlot.id == bindparam("slot_id")),
+    )
+    .on_conflict_do_nothing(index_elements=["time_slot_id"])
+    .returning(Booking.id, Booking.user_name, Booking.user_email, Booking.booked_at)
+    # Parameters feed the bindparams above, not ORM bulk-insert rows.
+    .execution_options(dml_strategy="raw")
+)
+# A no-op insert whose conflicting booking is gone by the follow-up lookup
+# is retried this many times before asking the client to try again.
+BOOKING_ATTEMPTS = 3
+SLOT_BOOKING_STMT = (
+    select(
+        TimeSlot.id,
+        Booking,
+        (Booking.user_email_lower == bindparam("user_email")).label("is_owner"),
+    )
+    .outerjoin(TimeSlot.booking)
+    .where(TimeSlot.id == bindparam("slot_id"))
+)
 
 
 @app.get("/health", tags=["meta"])
-def health_check() -> dict[str, str]:
+async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
 @app.get("/categories", response_model=list[CategoryRead], tags=["categories"])
-def list_categories(session: SessionDep) -> list[CategoryRead]:
-    categories = (
-        session.execute(select(EventCategory).order_by(EventCategory.id))
-        .scalars()
-        .all()
-    )
-    return [CategoryRead.model_validate(category) for category in categories]
+async def list_categories(session: SessionDep) -> Response:
+    global _categories_cache
+    if _categories_cache is None:
+        async with _categories_lock:
+            if _categories_cache is None:
+                categories = await session.scalars(
+                    select(EventCategory).order_by(EventCategory.id)
+                )
+                _categories_cache = orjson.dumps(
+                    CATEGORY_LIST_ADAPTER.dump_python(
+                        CATEGORY_LIST_ADAPTER.validate_python(
+                            categories.all(), from_attributes=True
+                        )
+                    )
+                )
+    return Response(content=_categories_cache, media_type="application/json")
 
 
 @app.post(
@@ -77,8 +212,10 @@ def list_categories(session: SessionDep) -> list[CategoryRead]:
     status_code=status.HTTP_201_CREATED,
     tags=["timeslots"],
 )
-def create_time_slot(payload: TimeSlotCreate, session: SessionDep) -> TimeSlotRead:
-    category = session.get(EventCategory, payload.category_id)
+async def create_time_slot(
+    payload: TimeSlotCreate, session: SessionDep
+) -> TimeSlotRead:
+    category = await session.get(EventCategory, payload.category_id)
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -91,107 +228,93 @@ def create_time_slot(payload: TimeSlotCreate, session: SessionDep) -> TimeSlotRe
             detail="End time must be after the start time.",
         )
 
-    overlapping = (
-        session.execute(
-            select(TimeSlot).where(
-                and_(
-                    TimeSlot.category_id == payload.category_id,
-                    or_(
-                        and_(
-                            payload.start_time >= TimeSlot.start_time,
-                            payload.start_time < TimeSlot.end_time,
-                        ),
-                        and_(
-                            payload.end_time > TimeSlot.start_time,
-                            payload.end_time <= TimeSlot.end_time,
-                        ),
-                        and_(
-                            payload.start_time <= TimeSlot.start_time,
-                            payload.end_time >= TimeSlot.end_time,
-                        ),
-                    ),
-                )
+    async with interval_cache.lock(payload.category_id):
+        # Known overlaps are rejected from memory; the database stays the
+        # authority for slots created by other processes.
+        if interval_cache.overlaps(
+            payload.category_id, payload.start_time, payload.end_time
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A timeslot already exists for the selected time range.",
             )
-        )
-        .scalars()
-        .first()
-    )
 
-    if overlapping:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="A timeslot already exists for the selected time range.",
+        overlapping = await session.scalar(
+            TIMESLOT_OVERLAP_STMT,
+            {
+                "category_id": payload.category_id,
+                "start_time": payload.start_time,
+                "end_time": payload.end_time,
+            },
         )
 
-    slot = TimeSlot(
-        category_id=payload.category_id,
-        start_time=payload.start_time,
-        end_time=payload.end_time,
-    )
-    session.add(slot)
-    session.commit()
-    session.refresh(slot)
-    return TimeSlotRead.model_validate(slot)
-
+        if overlapping is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A timeslot already exists for the selected time range.",
+            )
 
-@app.get("/timeslots", response_model=list[TimeSlotRead], tags=["timeslots"])
-def list_time_slots(
-    session: SessionDep,
-    start_date: Annotated[str, Query(description="Start date in YYYY-MM-DD format")],
-    end_date: Annotated[str, Query(description="End date in YYYY-MM-DD format")],
-    category_ids: Annotated[str | None, Query(description="Comma separated category ids")] = None,
-) -> list[TimeSlotRead]:
-    if not start_date or not end_date:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Start date and end date are required.",
+        slot = TimeSlot(
+            category_id=payload.category_id,
+            start_time=payload.start_time,
+            end_time=payload.end_time,
         )
+        session.add(slot)
+        await session.commit()
+        interval_cache.add(slot.category_id, slot.start_time, slot.end_time)
+
+    # Every column is known after the insert and a new slot has no booking,
+    # so the response is built without reading the row back.
+    set_committed_value(slot, "category", category)
+    set_committed_value(slot, "booking", None)
+    return TimeSlotRead.model_validate(slot)
 
-    try:
-        start_dt = datetime.fromisoformat(start_date)
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid start_date format. Use YYYY-MM-DD.",
-        ) from exc
-
-    try:
-        end_dt = datetime.fromisoformat(end_date)
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid end_date format. Use YYYY-MM-DD.",
-        ) from exc
 
-    if end_dt < start_dt:
+@app.get(
+    "/timeslots",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": list[TimeSlotRead]}},
+    tags=["timeslots"],
+)
+async def list_time_slots(
+    session: SessionDep,
+    start_date: Annotated[date, Query(description="Start date in YYYY-MM-DD format")],
+    end_date: Annotated[date, Query(description="End date in YYYY-MM-DD format")],
+    category_ids: Annotated[
+        list[int] | None, Query(description="Category ids, repeated per id")
+    ] = None,
+) -> ORJSONResponse:
+    if end_date < start_date:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="end_date must not be earlier than start_date.",
         )
 
+    start_dt = datetime.combine(start_date, time.min)
     # Expand to cover entire days
-    end_dt_inclusive = end_dt + timedelta(days=1)
-
-    query = select(TimeSlot).where(
-        and_(
-            TimeSlot.start_time >= start_dt,
-            TimeSlot.start_time < end_dt_inclusive,
-        )
-    )
+    end_dt_inclusive = datetime.combine(end_date + timedelta(days=1), time.min)
 
+    params = {"start": start_dt, "end": end_dt_inclusive}
     if category_ids:
-        try:
-            ids = [int(part) for part in category_ids.split(",") if part.strip()]
-        except ValueError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="category_ids must contain integers.",
-            ) from exc
-        if ids:
-            query = query.where(TimeSlot.category_id.in_(ids))
-
-    slots = session.execute(query.order_by(TimeSlot.start_time)).scalars().all()
-    return [TimeSlotRead.model_validate(slot) for slot in slots]
+        query = TIMESLOT_RANGE_BY_CATEGORY_STMT
+        params["category_ids"] = category_ids
+    else:
+        query = TIMESLOT_RANGE_STMT
+
+    slots = (await session.scalars(query, params)).all()
+    # Hand the connection back before waiting on the loader: its batched query
+    # needs one from the same pool, and holding ours while waiting starves it
+    # once concurrent requests exceed the pool size. The bookings are read
+    # just after the slots, so each slot's booking is at least as fresh.
+    await session.commit()
+    # Bookings come from the shared loader so concurrent list requests are
+    # answered by one batched query.
+    bookings = await booking_loader.load_many(slot.id for slot in slots)
+    for slot, booking in zip(slots, bookings):
+        set_committed_value(slot, "booking", booking)
+    validated = TIMESLOT_LIST_ADAPTER.validate_python(slots, from_attributes=True)
+    # orjson encodes the datetimes natively; skip FastAPI's jsonable_encoder.
+    return ORJSONResponse(content=TIMESLOT_LIST_ADAPTER.dump_python(validated))
 
 
 @app.post(
@@ -200,61 +323,98 @@ def list_time_slots(
     status_code=status.HTTP_201_CREATED,
     tags=["bookings"],
 )
-def book_time_slot(
+async def book_time_slot(
     slot_id: int,
     payload: BookingCreate,
     session: SessionDep,
 ) -> BookingRead:
-    slot = session.get(TimeSlot, slot_id)
-    if not slot:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Time slot not found.",
+    for _ in range(BOOKING_ATTEMPTS):
+        result = await session.execute(
+            BOOKING_INSERT_STMT,
+            {
+                "slot_id": slot_id,
+                "user_name": payload.user_name,
+                "user_email": payload.user_email,
+            },
         )
+        created = result.first()
+        await session.commit()
+        if created:
+            return BookingRead.model_validate(created)
+
+        existing = (
+            await session.execute(
+                SLOT_BOOKING_STMT,
+                {"slot_id": slot_id, "user_email": payload.user_email},
+            )
+        ).first()
+        if not existing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Time slot not found.",
+            )
+
+        if existing.Booking is None:
+            # The conflicting booking was cancelled after our insert; the slot
+            # is free again, so try once more.
+            continue
 
-    if slot.booking:
-        if slot.booking.user_email.lower() == payload.user_email.lower():
-            return BookingRead.model_validate(slot.booking)
+        if existing.is_owner:
+            return BookingRead.model_validate(existing.Booking)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="This time slot is already booked.",
         )
 
-    booking = Booking(
-        time_slot_id=slot.id,
-        user_name=payload.user_name.strip(),
-        user_email=payload.user_email.lower().strip(),
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="This time slot is changing too quickly; please try again.",
     )
-    session.add(booking)
-    session.commit()
-    session.refresh(booking)
-    return BookingRead.model_validate(booking)
 
 
 @app.post(
     "/timeslots/{slot_id}/cancel",
+    response_model=None,
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["bookings"],
 )
-def cancel_booking(slot_id: int, payload: BookingCancel, session: SessionDep) -> None:
-    slot = session.get(TimeSlot, slot_id)
-    if not slot:
+async def cancel_booking(
+    slot_id: int, payload: BookingCancel, session: SessionDep
+) -> None:
+    result = await session.execute(
+        delete(Booking)
+        .where(
+            Booking.time_slot_id == slot_id,
+            Booking.user_email_lower == payload.user_email,
+        )
+        .returning(Booking.id)
+    )
+    cancelled = result.first()
+    await session.commit()
+    if cancelled:
+        return
+
+    # Nothing was deleted; work out why with a single lookup.
+    existing = (
+        await session.execute(
+            select(TimeSlot.id, Booking.user_email)
+            .outerjoin(TimeSlot.booking)
+            .where(TimeSlot.id == slot_id)
+        )
+    ).first()
+    if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Time slot not found.",
         )
 
-    if not slot.booking:
+    if existing.user_email is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No booking found for this time slot.",
         )
 
-    if slot.booking.user_email.lower() != payload.user_email.lower():
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the original attendee can cancel this booking.",
-        )
-
-    session.delete(slot.booking)
-    session.commit()
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Only the original attendee can cancel this booking.",
+    )
@@ -3,9 +3,12 @@ from __future__ import annotations
 from datetime import datetime
 
 from sqlalchemy import (
+    CheckConstraint,
     Column,
+    Computed,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -39,11 +42,13 @@ class TimeSlot(Base):
             "end_time",
             name="uq_timeslot_category_time",
         ),
+        Index("ix_timeslot_start_cat", "start_time", "category_id"),
+        CheckConstraint("end_time > start_time", name="ck_timeslot_end_after_start"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     category_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("event_categories.id"), nullable=False, index=True
+        Integer, ForeignKey("event_categories.id"), nullable=False
     )
     start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     end_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -62,6 +67,11 @@ class TimeSlot(Base):
 
 class Booking(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        CheckConstraint(
+            "user_email = lower(trim(user_email))", name="ck_booking_email_normalized"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     time_slot_id: Mapped[int] = mapped_column(
@@ -72,7 +82,10 @@ class Booking(Base):
         index=True,
     )
     user_name: Mapped[str] = mapped_column(String(120), nullable=False)
-    user_email: Mapped[str] = mapped_column(String(160), nullable=False, index=True)
+    user_email: Mapped[str] = mapped_column(String(160), nullable=False)
+    user_email_lower: Mapped[str] = mapped_column(
+        String(160), Computed("lower(user_email)", persisted=True), index=True
+    )
     booked_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=datetime.utcnow
     )
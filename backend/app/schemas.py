@@ -1,6 +1,42 @@
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+)
+
+
+def _wall_time(value: datetime) -> datetime:
+    # SQLite DateTime columns keep the wall time and drop any offset; match
+    # that at the boundary so responses, the interval cache and stored rows
+    # all compare naive wall times.
+    return value.replace(tzinfo=None)
+
+
+WallTime = Annotated[datetime, AfterValidator(_wall_time)]
+
+
+def _strip(value: object) -> object:
+    return value.strip() if isinstance(value, str) else value
+
+
+def _normalize_email(value: object) -> object:
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+# Both are normalized before the length checks, so whitespace cannot pass
+# min_length and then be stored as an empty string.
+StrippedName = Annotated[
+    str, BeforeValidator(_strip), Field(min_length=1, max_length=120)
+]
+NormalizedEmail = Annotated[
+    str, BeforeValidator(_normalize_email), Field(min_length=3, max_length=160)
+]
 
 
 class CategoryBase(BaseModel):
@@ -11,22 +47,22 @@ class CategoryBase(BaseModel):
 class CategoryRead(CategoryBase):
     id: int
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TimeSlotCreate(BaseModel):
     category_id: int
-    start_time: datetime
-    end_time: datetime
+    start_time: WallTime
+    end_time: WallTime
 
 
 class BookingCreate(BaseModel):
-    user_name: str = Field(min_length=1, max_length=120)
-    user_email: str = Field(min_length=3, max_length=160)
+    user_name: StrippedName
+    user_email: NormalizedEmail
 
 
 class BookingCancel(BaseModel):
-    user_email: str = Field(min_length=3, max_length=160)
+    user_email: NormalizedEmail
 
 
 class BookingRead(BaseModel):
@@ -35,7 +71,7 @@ class BookingRead(BaseModel):
     user_email: str
     booked_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TimeSlotRead(BaseModel):
@@ -45,4 +81,8 @@ class TimeSlotRead(BaseModel):
     category: CategoryRead
     booking: BookingRead | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+CATEGORY_LIST_ADAPTER = TypeAdapter(list[CategoryRead])
+TIMESLOT_LIST_ADAPTER = TypeAdapter(list[TimeSlotRead])
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import tempfile
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import httpx
+import pytest
+
+# Point the app at a throwaway database before it creates its engine, and make
+# accidental lazy loads fail loudly.
+os.environ["DATABASE_URL"] = (
+    f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/event_booking_test.db"
+)
+os.environ["DEBUG"] = "1"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app import main  # noqa: E402
+from app.database import Base, engine  # noqa: E402
+from app.interval_cache import interval_cache  # noqa: E402
+
+
+@contextmanager
+def count_queries(conn) -> Iterator[list[str]]:
+    queries: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        queries.append(statement)
+
+    event.listen(conn, "before_cursor_execute", _record)
+    try:
+        yield queries
+    finally:
+        event.remove(conn, "before_cursor_execute", _record)
+
+
+async def _reset_database() -> None:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def reset_state() -> None:
+    asyncio.run(_reset_database())
+    main._categories_cache = None
+    interval_cache.load([])
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def run_concurrently() -> Callable[[Callable[[httpx.AsyncClient], Awaitable[Any]]], Any]:
+    """Run ``scenario`` against the app on one event loop, so requests overlap."""
+
+    def run(scenario: Callable[[httpx.AsyncClient], Awaitable[Any]]) -> Any:
+        async def _run() -> Any:
+            await main.init_database()
+            try:
+                async with httpx.AsyncClient(
+                    transport=httpx.ASGITransport(app=main.app),
+                    base_url="http://testserver",
+                ) as async_client:
+                    return await scenario(async_client)
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(_run())
+
+    return run
+
+
+@pytest.fixture
+def query_count() -> Callable[[], Any]:
+    return lambda: count_queries(engine.sync_engine)
+
+
+@pytest.fixture
+def create_slot(client: TestClient) -> Callable[..., httpx.Response]:
+    def create(start_time: str, end_time: str, category_id: int = 1) -> httpx.Response:
+        return client.post(
+            "/timeslots",
+            json={
+                "category_id": category_id,
+                "start_time": start_time,
+                "end_time": end_time,
+            },
+        )
+
+    return create
@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import IntegrityError
+
+from app.database import engine
+
+
+@pytest.fixture
+def slot(create_slot):
+    return create_slot("2025-01-06T09:00:00", "2025-01-06T10:00:00").json()
+
+
+def book(client, slot_id, email, name="Ann"):
+    return client.post(
+        f"/timeslots/{slot_id}/book", json={"user_name": name, "user_email": email}
+    )
+
+
+def cancel(client, slot_id, email):
+    return client.post(f"/timeslots/{slot_id}/cancel", json={"user_email": email})
+
+
+def test_book_stores_normalized_email(client, slot):
+    response = book(client, slot["id"], "  Ann@Example.COM ")
+
+    assert response.status_code == 201
+    assert response.json()["user_email"] == "ann@example.com"
+
+
+def test_rebooking_by_same_attendee_returns_existing_booking(client, slot):
+    first = book(client, slot["id"], "ann@example.com")
+    second = book(client, slot["id"], "ANN@example.com")
+
+    assert second.status_code == 201
+    assert second.json() == first.json()
+
+
+def test_booking_taken_slot_conflicts(client, slot):
+    book(client, slot["id"], "ann@example.com")
+
+    response = book(client, slot["id"], "bob@example.com", name="Bob")
+
+    assert response.status_code == 409
+
+
+def test_booking_missing_slot_is_not_found(client):
+    assert book(client, 999, "ann@example.com").status_code == 404
+
+
+def test_concurrent_bookings_have_a_single_winner(slot, run_concurrently):
+    async def scenario(async_client):
+        return await asyncio.gather(
+            *(
+                async_client.post(
+                    f"/timeslots/{slot['id']}/book",
+                    json={"user_name": "User", "user_email": f"user{i}@example.com"},
+                )
+                for i in range(20)
+            )
+        )
+
+    responses = run_concurrently(scenario)
+
+    assert sorted(response.status_code for response in responses) == [201] + [409] * 19
+
+
+def test_cancel_by_attendee_frees_the_slot(client, slot):
+    book(client, slot["id"], "ann@example.com")
+
+    response = cancel(client, slot["id"], "Ann@Example.com")
+
+    assert response.status_code == 204
+    assert response.content == b""
+    assert book(client, slot["id"], "bob@example.com", name="Bob").status_code == 201
+
+
+def test_cancel_by_other_attendee_is_forbidden(client, slot):
+    book(client, slot["id"], "ann@example.com")
+
+    assert cancel(client, slot["id"], "bob@example.com").status_code == 403
+
+
+def test_cancel_without_booking_is_not_found(client, slot):
+    response = cancel(client, slot["id"], "ann@example.com")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "No booking found for this time slot."
+
+
+def test_cancel_missing_slot_is_not_found(client):
+    response = cancel(client, 999, "ann@example.com")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Time slot not found."
+
+
+def test_booking_retries_when_conflict_is_cancelled_mid_request(client, slot):
+    book(client, slot["id"], "ann@example.com")
+    cancelled = False
+
+    def cancel_before_lookup(conn, cursor, statement, parameters, context, executemany):
+        # Simulates the attendee cancelling between the no-op insert and the
+        # follow-up lookup of the conflicting booking.
+        nonlocal cancelled
+        if not cancelled and statement.startswith("SELECT time_slots.id, bookings"):
+            cancelled = True
+            cursor.execute("DELETE FROM bookings")
+
+    event.listen(engine.sync_engine, "before_cursor_execute", cancel_before_lookup)
+    try:
+        response = book(client, slot["id"], "bob@example.com", name="Bob")
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", cancel_before_lookup)
+
+    assert cancelled
+    assert response.status_code == 201
+    assert response.json()["user_email"] == "bob@example.com"
+
+
+@pytest.mark.parametrize("email", ["   ", " a ", "x" * 161])
+def test_email_length_applies_after_normalization(client, slot, email):
+    assert book(client, slot["id"], email).status_code == 422
+    assert cancel(client, slot["id"], email).status_code == 422
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "INSERT INTO time_slots (category_id, start_time, end_time) "
+        "VALUES (1, '2025-01-06 10:00:00', '2025-01-06 09:00:00')",
+        "INSERT INTO bookings (time_slot_id, user_name, user_email, booked_at) "
+        "VALUES (1, 'Ann', 'Ann@Example.com', '2025-01-01 00:00:00')",
+    ],
+)
+def test_database_rejects_denormalized_rows(client, slot, statement):
+    async def insert():
+        try:
+            async with engine.begin() as connection:
+                await connection.execute(text(statement))
+        finally:
+            await engine.dispose()
+
+    with pytest.raises(IntegrityError, match="CHECK constraint failed"):
+        asyncio.run(insert())
+
+
+def test_user_name_is_stripped_before_validation(client, slot):
+    assert book(client, slot["id"], "ann@example.com", name="   ").status_code == 422
+
+    response = book(client, slot["id"], "ann@example.com", name="  Ann  ")
+
+    assert response.status_code == 201
+    assert response.json()["user_name"] == "Ann"
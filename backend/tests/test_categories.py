@@ -0,0 +1,21 @@
+def test_list_categories_returns_seeded_categories(client):
+    response = client.get("/categories")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [
+        {"id": 1, "name": "Cat 1", "description": None},
+        {"id": 2, "name": "Cat 2", "description": None},
+        {"id": 3, "name": "Cat 3", "description": None},
+    ]
+
+
+def test_list_categories_is_served_from_cache(client, query_count):
+    first = client.get("/categories")
+
+    with query_count() as queries:
+        second = client.get("/categories")
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert queries == []
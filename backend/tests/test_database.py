@@ -0,0 +1,11 @@
+from sqlalchemy import text
+
+from app.database import engine
+
+
+def test_sqlite_connections_use_wal(run_concurrently):
+    async def scenario(async_client):
+        async with engine.connect() as connection:
+            return await connection.scalar(text("PRAGMA journal_mode"))
+
+    assert run_concurrently(scenario) == "wal"
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from app.interval_cache import IntervalCache
+
+
+def at(hour: int) -> datetime:
+    return datetime(2025, 1, 6, hour)
+
+
+def test_overlaps_detects_only_intersecting_intervals():
+    cache = IntervalCache()
+    cache.load([(1, at(9), at(10)), (1, at(12), at(13))])
+
+    assert cache.overlaps(1, at(9), at(11))
+    assert cache.overlaps(1, at(8), at(14))
+    assert not cache.overlaps(1, at(10), at(12))
+    assert not cache.overlaps(1, at(13), at(14))
+    assert not cache.overlaps(2, at(9), at(10))
+
+
+def test_add_makes_interval_visible():
+    cache = IntervalCache()
+
+    cache.add(1, at(9), at(10), now=at(8))
+
+    assert cache.overlaps(1, at(9), at(10))
+
+
+
+def test_add_prunes_ended_slots_in_category():
+    cache = IntervalCache()
+    cache.add(1, at(8), at(9), now=at(7))
+    cache.add(1, at(10), at(11), now=at(7))
+    cache.add(2, at(8), at(9), now=at(7))
+
+    cache.add(1, at(12), at(13), now=at(10))
+
+    assert not cache.overlaps(1, at(8), at(9))
+    assert cache.overlaps(1, at(10), at(11))
+    assert cache.overlaps(1, at(12), at(13))
+    assert cache.overlaps(2, at(8), at(9))
+
+
+def test_add_skips_slots_that_already_ended():
+    cache = IntervalCache()
+
+    cache.add(1, at(8), at(9), now=at(10))
+
+    assert not cache.overlaps(1, at(8), at(9))
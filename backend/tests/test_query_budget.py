@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+
+WEEK_START = datetime(2025, 1, 6, 8)
+
+
+def test_list_timeslots_query_budget(client, create_slot, query_count):
+    for offset in range(50):
+        start = WEEK_START + timedelta(hours=offset)
+        slot = create_slot(
+            start.isoformat(), (start + timedelta(hours=1)).isoformat()
+        ).json()
+        booked = client.post(
+            f"/timeslots/{slot['id']}/book",
+            json={"user_name": "Ann", "user_email": "ann@example.com"},
+        )
+        assert booked.status_code == 201
+
+    with query_count() as queries:
+        response = client.get(
+            "/timeslots", params={"start_date": "2025-01-06", "end_date": "2025-01-12"}
+        )
+
+    assert response.status_code == 200
+    slots = response.json()
+    assert len(slots) == 50
+    assert all(slot["booking"] and slot["category"] for slot in slots)
+    assert len(queries) <= 3
+
+
+def test_book_time_slot_query_budget(client, create_slot, query_count):
+    slot = create_slot("2025-01-06T09:00:00", "2025-01-06T10:00:00").json()
+
+    with query_count() as queries:
+        response = client.post(
+            f"/timeslots/{slot['id']}/book",
+            json={"user_name": "Ann", "user_email": "ann@example.com"},
+        )
+
+    assert response.status_code == 201
+    assert len(queries) <= 2
@@ -0,0 +1,144 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from app import main
+from app.database import engine
+from app.interval_cache import interval_cache
+
+
+@pytest.mark.parametrize(
+    ("start_time", "end_time"),
+    [
+        ("2025-01-06T09:30:00", "2025-01-06T10:30:00"),
+        ("2025-01-06T08:30:00", "2025-01-06T09:30:00"),
+        ("2025-01-06T08:00:00", "2025-01-06T11:00:00"),
+        ("2025-01-06T09:15:00", "2025-01-06T09:45:00"),
+    ],
+)
+def test_overlapping_slot_conflicts(create_slot, start_time, end_time):
+    create_slot("2025-01-06T09:00:00", "2025-01-06T10:00:00")
+
+    assert create_slot(start_time, end_time).status_code == 409
+
+
+def test_adjacent_and_other_category_slots_are_allowed(create_slot):
+    create_slot("2025-01-06T09:00:00", "2025-01-06T10:00:00")
+
+    assert create_slot("2025-01-06T10:00:00", "2025-01-06T11:00:00").status_code == 201
+    assert create_slot("2025-01-06T08:00:00", "2025-01-06T09:00:00").status_code == 201
+    assert (
+        create_slot("2025-01-06T09:00:00", "2025-01-06T10:00:00", category_id=2).status_code
+        == 201
+    )
+
+
+def test_database_rejects_overlap_missing_from_interval_cache(create_slot):
+    create_slot("2025-01-06T09:00:00", "2025-01-06T10:00:00")
+    interval_cache.load([])
+
+    assert create_slot("2025-01-06T09:30:00", "2025-01-06T10:30:00").status_code == 409
+
+
+def test_create_validates_category_and_range(create_slot):
+    missing = create_slot("2025-01-06T09:00:00", "2025-01-06T10:00:00", category_id=99)
+    reversed_range = create_slot("2025-01-06T10:00:00", "2025-01-06T09:00:00")
+
+    assert missing.status_code == 404
+    assert reversed_range.status_code == 400
+
+
+def test_list_filters_by_week_and_category(client, create_slot):
+    create_slot("2025-01-06T09:00:00", "2025-01-06T10:00:00")
+    create_slot("2025-01-12T09:00:00", "2025-01-12T10:00:00", category_id=2)
+    create_slot("2025-01-13T09:00:00", "2025-01-13T10:00:00")
+
+    week = {"start_date": "2025-01-06", "end_date": "2025-01-12"}
+    everything = client.get("/timeslots", params=week).json()
+    filtered = client.get("/timeslots", params={**week, "category_ids": [2]}).json()
+
+    assert [slot["start_time"] for slot in everything] == [
+        "2025-01-06T09:00:00",
+        "2025-01-12T09:00:00",
+    ]
+    assert [slot["category"]["id"] for slot in filtered] == [2]
+
+
+def test_list_rejects_reversed_dates(client):
+    response = client.get(
+        "/timeslots", params={"start_date": "2025-01-12", "end_date": "2025-01-06"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_concurrent_list_requests_beyond_pool_size(create_slot, client, run_concurrently):
+    slot = create_slot("2025-01-06T09:00:00", "2025-01-06T10:00:00").json()
+    client.post(
+        f"/timeslots/{slot['id']}/book",
+        json={"user_name": "Ann", "user_email": "ann@example.com"},
+    )
+    week = {"start_date": "2025-01-06", "end_date": "2025-01-12"}
+
+    async def scenario(async_client):
+        return await asyncio.gather(
+            *(async_client.get("/timeslots", params=week) for _ in range(100))
+        )
+
+    responses = run_concurrently(scenario)
+
+    assert {response.status_code for response in responses} == {200}
+    assert all(response.json()[0]["booking"] for response in responses)
+
+
+def test_startup_rejects_database_missing_columns():
+    async def scenario():
+        async with engine.begin() as connection:
+            await connection.execute(
+                text(
+                    "CREATE TABLE bookings (id INTEGER PRIMARY KEY, "
+                    "time_slot_id INTEGER NOT NULL UNIQUE, user_name VARCHAR(120), "
+                    "user_email VARCHAR(160), booked_at DATETIME)"
+                )
+            )
+        try:
+            await main.init_database()
+        finally:
+            await engine.dispose()
+
+    with pytest.raises(RuntimeError, match="bookings.user_email_lower"):
+        asyncio.run(scenario())
+
+
+def test_create_response_matches_stored_wall_time(client, create_slot):
+    created = create_slot("2025-01-06T10:00:00+02:00", "2025-01-06T11:00:00Z").json()
+    listed = client.get(
+        "/timeslots", params={"start_date": "2025-01-06", "end_date": "2025-01-06"}
+    ).json()
+
+    assert created["start_time"] == "2025-01-06T10:00:00"
+    assert created["end_time"] == "2025-01-06T11:00:00"
+    assert listed[0]["start_time"] == created["start_time"]
+    assert listed[0]["end_time"] == created["end_time"]
+
+
+def test_startup_caches_only_upcoming_slots(create_slot):
+    past = ("2020-01-06T09:00:00", "2020-01-06T10:00:00")
+    upcoming = ("2999-01-06T09:00:00", "2999-01-06T10:00:00")
+    create_slot(*past)
+    create_slot(*upcoming)
+
+    asyncio.run(_reload_interval_cache())
+
+    assert not interval_cache.overlaps(1, *map(datetime.fromisoformat, past))
+    assert interval_cache.overlaps(1, *map(datetime.fromisoformat, upcoming))
+    assert create_slot(*past).status_code == 409
+
+
+async def _reload_interval_cache():
+    try:
+        await main.init_database()
+    finally:
+        await engine.dispose()
@@ -26,11 +26,8 @@ export class ApiService {
       .set('start_date', params.startDate)
       .set('end_date', params.endDate);
 
-    if (params.categoryIds?.length) {
-      httpParams = httpParams.set(
-        'category_ids',
-        params.categoryIds.join(',')
-      );
+    for (const categoryId of params.categoryIds ?? []) {
+      httpParams = httpParams.append('category_ids', String(categoryId));
     }
 
     if (params.includeEmpty !== undefined) {